@@ -7,6 +7,7 @@ import csv
 import pandas as pd
 import re
 from collections import defaultdict
+from voltage_quality import VoltageQualityAnalyzer, parse_event_time
 
 class EnergomeraAnalyzer:
     def __init__(self):
@@ -28,6 +29,12 @@ class EnergomeraAnalyzer:
                 'overvoltage': {'A': [], 'B': [], 'C': []},
                 'undervoltage': {'A': [], 'B': [], 'C': []}
             }
+            # Все события окончания с длительностью - для метрик качества напряжения
+            intervals = []
+            # Время всех строк журнала - наблюдаемый период для метрик
+            journal_times = []
+            # Порог счетчика, % от номинала - отклонения внутри него не журналируются
+            thresholds = []
             
             with open(temp_csv, 'r', encoding='utf-8') as f:
                 reader = csv.reader(f)
@@ -48,19 +55,21 @@ class EnergomeraAnalyzer:
                     # Извлекаем данные из колонок
                     datetime_str = row[0]  # A - Дата/время
                     event = row[1]         # B - Событие
-                    # C - Порог напряжения (не используем)
+                    threshold_str = row[2]  # C - Порог напряжения, В
                     # D - Порог, % (не используем)
                     voltage_str = row[4]   # E - Мин./макс. значение напряжения, В
                     # F - Глубина/высота/уровень, % (не используем)
                     duration_str = row[6]  # G - Длительность, с
                     
+                    row_time = parse_event_time(datetime_str)
+                    if row_time is not None:
+                        journal_times.append(row_time)
+                    
                     # Парсим значения
                     voltage = float(voltage_str.replace(',', '.'))
                     duration = float(duration_str.replace(',', '.'))
                     
                     # Фильтры
-                    if duration <= 60:
-                        continue
                     if abs(voltage - 11.50) < 0.001 or voltage == 0:
                         continue
                     
@@ -92,6 +101,24 @@ class EnergomeraAnalyzer:
                     
                     # Сохраняем событие
                     if phase and event_type:
+                        try:
+                            threshold = float(threshold_str.replace(',', '.'))
+                            if threshold > 0:
+                                thresholds.append(round(abs(threshold - 220) / 220 * 100, 2))
+                        except ValueError:
+                            pass
+                        
+                        if row_time is None:
+                            print(f"Строка {idx}: не распознано время '{datetime_str}', событие не учтено в метриках качества", file=sys.stderr)
+                        else:
+                            intervals.append({
+                                'phase': phase,
+                                'end': row_time,
+                                'duration': duration,
+                                'voltage': voltage
+                            })
+                        if duration <= 60:
+                            continue
                         events_data[event_type][phase].append({
                             'voltage': voltage,
                             'month': month,
@@ -101,7 +128,15 @@ class EnergomeraAnalyzer:
                 except Exception as e:
                     continue
             
-            return self._generate_result(events_data)
+            result = self._generate_result(events_data)
+            try:
+                period = (min(journal_times), max(journal_times)) if journal_times else None
+                threshold_percent = max(thresholds) if thresholds else None
+                result['quality'] = VoltageQualityAnalyzer().compute(intervals, period, threshold_percent)
+            except Exception as e:
+                print(f"Ошибка расчета метрик качества напряжения: {str(e)}", file=sys.stderr)
+                result['quality'] = {}
+            return result
             
         except Exception as e:
             return {
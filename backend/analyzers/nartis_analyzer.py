@@ -7,6 +7,7 @@ from collections import defaultdict
 import re
 import xlrd
 from datetime import datetime
+from voltage_quality import VoltageQualityAnalyzer, parse_event_time
 
 class NartisAnalyzer:
     def __init__(self):
@@ -22,6 +23,10 @@ class NartisAnalyzer:
                 'overvoltage': {'A': [], 'B': [], 'C': []},
                 'undervoltage': {'A': [], 'B': [], 'C': []}
             }
+            # Все события окончания с длительностью - для метрик качества напряжения
+            intervals = []
+            # Время всех строк журнала - наблюдаемый период для метрик
+            journal_times = []
             
             # ВАЖНО: для .xls файлов используем formatting_info=True
             try:
@@ -67,6 +72,10 @@ class NartisAnalyzer:
                     if datetime_str == 'Время' or event == 'Событие журнала напряжений':
                         continue
                     
+                    row_time = parse_event_time(datetime_str)
+                    if row_time is not None:
+                        journal_times.append(row_time)
+                    
                     voltage_str = str(sheet.cell_value(row_idx, 2)).replace(',', '.') if sheet.cell_value(row_idx, 2) else "0"
                     
                     try:
@@ -86,10 +95,6 @@ class NartisAnalyzer:
                     percent = float(percent_str)
                     duration = float(duration_str)
                     
-                    if duration <= 60:
-                        print(f"Skipped: duration {duration} <= 60", file=sys.stderr)
-                        continue
-                    
                     if abs(voltage - 11.50) < 0.001 or voltage == 0:
                         print(f"Skipped: voltage {voltage} is 11.50 or 0", file=sys.stderr)
                         continue
@@ -114,14 +119,28 @@ class NartisAnalyzer:
                     if phase:
                         if 'Окончание провала' in event:
                             event_type = 'undervoltage'
-                            if voltage >= self.UNDERVOLTAGE_THRESHOLD:
-                                continue
                         elif 'Окончание перенапряжения' in event:
                             event_type = 'overvoltage'
-                            if voltage <= self.OVERVOLTAGE_THRESHOLD:
-                                continue
                     
                     if phase and event_type:
+                        if row_time is None:
+                            print(f"Row {row_idx}: не распознано время '{datetime_str}', событие не учтено в метриках качества", file=sys.stderr)
+                        else:
+                            intervals.append({
+                                'phase': phase,
+                                'end': row_time,
+                                'duration': duration,
+                                'voltage': voltage
+                            })
+                        
+                        if duration <= 60:
+                            print(f"Skipped: duration {duration} <= 60", file=sys.stderr)
+                            continue
+                        if event_type == 'undervoltage' and voltage >= self.UNDERVOLTAGE_THRESHOLD:
+                            continue
+                        if event_type == 'overvoltage' and voltage <= self.OVERVOLTAGE_THRESHOLD:
+                            continue
+                        
                         events_data[event_type][phase].append({
                             'voltage': voltage,
                             'month': month,
@@ -132,7 +151,14 @@ class NartisAnalyzer:
                     print(f"Error in row {row_idx}: {str(e)}", file=sys.stderr)
                     continue
             
-            return self._generate_result(events_data)
+            result = self._generate_result(events_data)
+            try:
+                period = (min(journal_times), max(journal_times)) if journal_times else None
+                result['quality'] = VoltageQualityAnalyzer().compute(intervals, period)
+            except Exception as e:
+                print(f"Ошибка расчета метрик качества напряжения: {str(e)}", file=sys.stderr)
+                result['quality'] = {}
+            return result
             
         except xlrd.biffh.XLRDError as e:
             return {
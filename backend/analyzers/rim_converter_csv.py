@@ -7,6 +7,7 @@ import csv
 import pandas as pd
 import re
 from collections import defaultdict
+from voltage_quality import VoltageQualityAnalyzer, parse_event_time
 
 class RIMAnalyzer:
     def __init__(self):
@@ -28,6 +29,10 @@ class RIMAnalyzer:
                 'overvoltage': {'A': [], 'B': [], 'C': []},
                 'undervoltage': {'A': [], 'B': [], 'C': []}
             }
+            # Все события окончания с длительностью - для метрик качества напряжения
+            intervals = []
+            # Время всех строк журнала - наблюдаемый период для метрик
+            journal_times = []
             
             with open(temp_csv, 'r', encoding='utf-8') as f:
                 reader = csv.reader(f)
@@ -57,7 +62,7 @@ class RIMAnalyzer:
             # Счетчики для отладки
             total_rows = 0
             total_events = 0
-            filtered_by_duration = 0
+            short_events = 0
             filtered_by_voltage = 0
             no_date = 0
             no_phase = 0
@@ -76,6 +81,10 @@ class RIMAnalyzer:
                     datetime_str = str(row[0])
                     event = str(row[1])
                     
+                    row_time = parse_event_time(datetime_str)
+                    if row_time is not None:
+                        journal_times.append(row_time)
+                    
                     # Парсим числа с запятой
                     try:
                         voltage = float(str(row[2]).replace(',', '.'))
@@ -88,9 +97,6 @@ class RIMAnalyzer:
                         continue
                     
                     # Фильтры
-                    if duration <= 60:
-                        filtered_by_duration += 1
-                        continue
                     if abs(voltage - 11.50) < 0.001 or voltage == 0:
                         filtered_by_voltage += 1
                         continue
@@ -121,6 +127,18 @@ class RIMAnalyzer:
                             event_type = 'overvoltage'
                     
                     if phase and event_type:
+                        if row_time is None:
+                            print(f"Строка {idx}: не распознано время '{datetime_str}', событие не учтено в метриках качества", file=sys.stderr)
+                        else:
+                            intervals.append({
+                                'phase': phase,
+                                'end': row_time,
+                                'duration': duration,
+                                'voltage': voltage
+                            })
+                        if duration <= 60:
+                            short_events += 1
+                            continue
                         total_events += 1
                         events_data[event_type][phase].append({
                             'voltage': voltage,
@@ -141,7 +159,7 @@ class RIMAnalyzer:
             print(f"\n=== СТАТИСТИКА ОБРАБОТКИ ===", file=sys.stderr)
             print(f"Всего строк обработано: {total_rows}", file=sys.stderr)
             print(f"Событий найдено: {total_events}", file=sys.stderr)
-            print(f"Отфильтровано по длительности (<=60с): {filtered_by_duration}", file=sys.stderr)
+            print(f"Событий фазы ≤60с (не вошли в подсчет): {short_events}", file=sys.stderr)
             print(f"Отфильтровано по напряжению (11.5В или 0В): {filtered_by_voltage}", file=sys.stderr)
             print(f"Не найдена дата: {no_date}", file=sys.stderr)
             print(f"Не определена фаза/тип: {no_phase}", file=sys.stderr)
@@ -153,7 +171,14 @@ class RIMAnalyzer:
                     if count > 0:
                         print(f"{event_type} фаза {phase}: {count} событий", file=sys.stderr)
             
-            return self._generate_result(events_data)
+            result = self._generate_result(events_data)
+            try:
+                period = (min(journal_times), max(journal_times)) if journal_times else None
+                result['quality'] = VoltageQualityAnalyzer().compute(intervals, period)
+            except Exception as e:
+                print(f"Ошибка расчета метрик качества напряжения: {str(e)}", file=sys.stderr)
+                result['quality'] = {}
+            return result
             
         except Exception as e:
             return {
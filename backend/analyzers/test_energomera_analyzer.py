@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+
+import pandas as pd
+
+import energomera_analyzer
+from energomera_analyzer import EnergomeraAnalyzer
+
+HEADER = [
+    'Дата/время', 'Событие', 'Порог напряжения, В', 'Порог, %',
+    'Мин./макс. значение напряжения, В', 'Глубина/высота/уровень, %', 'Длительность, с',
+    'Время работы счетчика'
+]
+
+
+def journal_row(datetime_str, event, voltage, duration):
+    return [datetime_str, event, '198', '10', str(voltage), '0', str(duration), '0']
+
+
+def test_quality_kept_out_of_notification_details(monkeypatch, tmp_path):
+    rows = [HEADER]
+    for day in range(1, 12):
+        rows.append(journal_row(f'{day:02d}.08.2025 10:00:00', 'Окончание провала напряжения, фаза А', 190, 120))
+    # Короткие события других фаз - в метриках качества, но не в ошибках
+    rows.append(journal_row('05.08.2025 12:00:00', 'Окончание провала напряжения, фаза B', 200, 10))
+    rows.append(journal_row('06.08.2025 12:00:00', 'Фаза С: перенапряжение, окончание', 250, 30))
+    rows.append(journal_row('20.08.2025 00:00:00', 'Включение счетчика', 0, 0))
+    monkeypatch.setattr(energomera_analyzer.pd, 'read_excel', lambda *args, **kwargs: pd.DataFrame(rows))
+
+    result = EnergomeraAnalyzer().analyze_file(str(tmp_path / 'journal.xlsx'))
+
+    assert result['success'] and result['has_errors']
+    # Фронтенд ищет phase_X в тексте details для индикаторов фаз уведомления
+    details_text = json.dumps(result['details'])
+    assert 'phase_A' in details_text
+    assert 'phase_B' not in details_text and 'phase_C' not in details_text
+
+    quality = result['quality']
+    assert set(quality) == {'meter_threshold', 'phase_A', 'phase_B', 'phase_C'}
+    assert quality['meter_threshold'] == 10.0
+    assert quality['phase_B']['worst_out_5'] is None
+    # Период журнала - до последней строки любого типа
+    assert quality['phase_A']['weeks'][-1]['week'] == '18.08.2025'
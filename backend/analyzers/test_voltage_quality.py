@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from voltage_quality import WEEK_SECONDS, VoltageQualityAnalyzer, parse_event_time
+
+HOUR = 3600
+DAY = 24 * HOUR
+# Понедельник 04.08.2025 00:00
+MONDAY = parse_event_time('04.08.2025 00:00:00')
+
+
+def event(phase, start, duration, voltage):
+    return {'phase': phase, 'end': start + duration, 'duration': duration, 'voltage': voltage}
+
+
+def brute_force(intervals, phase, band, period=None):
+    """Посекундное покрытие: доля наблюдаемого времени каждой недели вне полосы"""
+    starts = [i['end'] - i['duration'] for i in intervals]
+    span_start, span_end = min(starts), max(i['end'] for i in intervals)
+    if period is not None:
+        span_start, span_end = min(span_start, period[0]), max(span_end, period[1])
+    first_week = MONDAY + (span_start - MONDAY) // WEEK_SECONDS * WEEK_SECONDS
+
+    covered = np.zeros(span_end - first_week, dtype=bool)
+    for i, start in zip(intervals, starts):
+        if i['phase'] == phase and abs(i['voltage'] - 220) / 220 * 100 > band:
+            covered[start - first_week:i['end'] - first_week] = True
+
+    percents = []
+    week_start = first_week
+    while week_start < span_end or week_start == first_week:
+        lo = max(week_start, span_start) - first_week
+        hi = min(week_start + WEEK_SECONDS, span_end) - first_week
+        observed = hi - lo
+        percents.append(covered[lo:hi].sum() / observed * 100 if observed > 0 else 0.0)
+        week_start += WEEK_SECONDS
+    return percents
+
+
+def assert_matches_brute_force(intervals, period=None):
+    result = VoltageQualityAnalyzer().compute(intervals, period)
+    for phase in {i['phase'] for i in intervals}:
+        weeks = result[f'phase_{phase}']['weeks']
+        for band in (5, 10):
+            expected = brute_force(intervals, phase, band, period)
+            actual = [w[f'out_{band}'] for w in weeks]
+            assert actual == pytest.approx(expected, abs=0.005)
+    return result
+
+
+def test_overlapping_and_touching_intervals():
+    intervals = [
+        event('A', MONDAY + DAY, 2 * HOUR, 190),
+        event('A', MONDAY + DAY + HOUR, 2 * HOUR, 205),
+        event('A', MONDAY + DAY + 3 * HOUR, HOUR, 180),
+        event('A', MONDAY + DAY + 30 * 60, 10 * 60, 200),
+        event('A', MONDAY + 8 * DAY, 30, 240),
+    ]
+    result = assert_matches_brute_force(intervals)
+    # 4 часа вне ±5% без двойного счета пересечений
+    assert result['phase_A']['hours_out_5'] == 4.0
+
+
+def test_interval_spanning_several_weeks():
+    intervals = [
+        event('B', MONDAY + 2 * DAY, HOUR, 250),
+        event('B', MONDAY + 5 * DAY, 12 * DAY, 170),
+        event('B', MONDAY + 20 * DAY, 10 * 60, 230),
+    ]
+    result = assert_matches_brute_force(intervals)
+    weeks = result['phase_B']['weeks']
+    assert [w['complete'] for w in weeks] == [False, True, False]
+    assert result['phase_B']['worst_out_10'] == 100.0
+
+
+def test_mixed_phases_and_empty_band():
+    intervals = [
+        event('A', MONDAY + 3 * DAY, 5 * HOUR, 212),
+        event('B', MONDAY + 10 * DAY, 40 * HOUR, 200),
+        event('C', MONDAY + 6 * DAY + 23 * HOUR, 2 * HOUR, 260),
+        event('A', MONDAY + 15 * DAY, 90, 195),
+    ]
+    result = assert_matches_brute_force(intervals)
+    assert result['phase_A']['hours_out_5'] == 0.0
+    assert result['phase_B']['hours_out_10'] == 0.0
+
+
+def test_band_starting_after_first_edge():
+    intervals = [
+        event('A', MONDAY + 2 * HOUR, 60, 215),
+        event('A', MONDAY + 9 * DAY, 3 * HOUR, 185),
+    ]
+    assert_matches_brute_force(intervals)
+
+
+def test_journal_period_includes_quiet_weeks():
+    intervals = [event('A', MONDAY + 7 * DAY, 14 * DAY, 175)]
+    result = assert_matches_brute_force(intervals, period=(MONDAY, MONDAY + 35 * DAY))
+    weeks = result['phase_A']['weeks']
+    assert [w['out_10'] for w in weeks] == [0.0, 100.0, 100.0, 0.0, 0.0]
+    assert all(w['complete'] for w in weeks)
+
+    # Период журнала внутри события расширяется до его границ
+    assert_matches_brute_force(intervals, period=(MONDAY + 10 * DAY, MONDAY + 12 * DAY))
+
+
+def test_meter_threshold_wider_than_band():
+    intervals = [event('A', MONDAY, 8 * DAY, 190)]
+    period = (MONDAY, MONDAY + 14 * DAY)
+
+    phase = VoltageQualityAnalyzer().compute(intervals, period, threshold_percent=10.0)['phase_A']
+    assert phase['worst_out_5'] is None and phase['hours_out_5'] is None
+    assert all(w['out_5'] is None for w in phase['weeks'])
+    assert phase['worst_out_10'] == 100.0
+
+    phase = VoltageQualityAnalyzer().compute(intervals, period, threshold_percent=15.0)['phase_A']
+    assert phase['worst_out_5'] is None and phase['worst_out_10'] is None
+
+    phase = VoltageQualityAnalyzer().compute(intervals, period, threshold_percent=5.0)['phase_A']
+    assert phase['worst_out_5'] == 100.0
+
+
+def test_covered_until_exact():
+    starts = np.array([50, 0, 10, 30, 30, 80, 90], dtype=np.int64)
+    ends = np.array([60, 10, 25, 40, 35, 100, 95], dtype=np.int64)
+    points = np.arange(-5, 110, dtype=np.int64)
+
+    covered = np.zeros(120, dtype=bool)
+    for start, end in zip(starts, ends):
+        covered[start:end] = True
+    expected = [covered[:max(p, 0)].sum() for p in points]
+
+    analyzer = VoltageQualityAnalyzer()
+    merged_starts, merged_ends = analyzer._merge(starts, ends)
+    assert merged_starts.tolist() == [0, 30, 50, 80]
+    assert merged_ends.tolist() == [25, 40, 60, 100]
+    assert analyzer._covered_until(merged_starts, merged_ends, points).tolist() == expected
+    assert analyzer._covered_until(starts[:0], ends[:0], points).tolist() == [0] * len(points)
+
+
+def test_no_complete_weeks():
+    result = VoltageQualityAnalyzer().compute([event('C', MONDAY + DAY, HOUR, 180)])
+    assert result['phase_C']['weeks'][0]['out_10'] == 100.0
+    assert result['phase_C']['worst_out_10'] is None
+
+
+def test_empty_journal():
+    assert VoltageQualityAnalyzer().compute([]) == {}
+
+
+def test_parse_event_time():
+    assert parse_event_time('09.08.2025 07:34:16') - parse_event_time('08.08.2025 07:34') == DAY + 16
+    assert parse_event_time(' 08.08.2025 ') == parse_event_time('08.08.2025 00:00:00')
+    assert parse_event_time('2025-08-08 07:34:16') is None
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import calendar
+from datetime import datetime, timezone
+
+import numpy as np
+
+WEEK_SECONDS = 7 * 24 * 3600
+# 01.01.1970 - четверг, сдвиг до понедельника для выравнивания недель
+MONDAY_OFFSET = 4 * 24 * 3600
+EVENT_TIME_FORMATS = ('%d.%m.%Y %H:%M:%S', '%d.%m.%Y %H:%M', '%d.%m.%Y')
+
+
+def parse_event_time(datetime_str):
+    """Время события 'ДД.ММ.ГГГГ ЧЧ:ММ[:СС]' в секундах эпохи, None если формат не распознан"""
+    value = str(datetime_str).strip()
+    for fmt in EVENT_TIME_FORMATS:
+        try:
+            return calendar.timegm(datetime.strptime(value, fmt).timetuple())
+        except ValueError:
+            continue
+    return None
+
+
+class VoltageQualityAnalyzer:
+    """Доля времени вне ±5% и ±10% от номинала по недельным интервалам"""
+
+    def __init__(self):
+        self.NOMINAL_VOLTAGE = 220
+        self.BANDS = (5, 10)
+
+    def compute(self, intervals, period=None, threshold_percent=None):
+        """Расчет метрик по событиям вида {'phase', 'end', 'duration', 'voltage'}
+
+        'end' - время окончания события в секундах эпохи (см. parse_event_time).
+        Каждое событие превращается в интервал [end - duration, end], которому
+        приписывается экстремальное напряжение события. Пересекающиеся интервалы
+        одной фазы объединяются, после чего считается доля наблюдаемого времени
+        каждой недели, покрытая интервалами вне ±5% и ±10%. Сложность O(n log n).
+
+        period - (начало, конец) журнала по первой и последней строке любого
+        типа; при необходимости расширяется до границ событий. Неполные недели
+        на краях периода помечены 'complete': False и не входят в worst_*.
+
+        Проценты - оценка сверху только по записанным событиям: интервалу
+        приписывается экстремальное напряжение, а ГОСТ 32144 нормирует
+        10-минутные средние, поэтому вердикт о соответствии здесь не выносится.
+        Отклонения внутри порога счетчика в журнал не попадают, поэтому если
+        порог (threshold_percent) шире полосы, метрики полосы равны None.
+        """
+        if not intervals:
+            return {}
+
+        ends = np.array([i['end'] for i in intervals], dtype=np.int64)
+        durations = np.clip(np.array([i['duration'] for i in intervals], dtype=float), 0, None)
+        starts = ends - durations.astype(np.int64)
+        voltages = np.array([i['voltage'] for i in intervals], dtype=float)
+        deviation = np.abs(voltages - self.NOMINAL_VOLTAGE) / self.NOMINAL_VOLTAGE * 100
+        phases = np.array([i['phase'] for i in intervals])
+
+        # Общая сетка недель для всех фаз (с понедельника 00:00)
+        span_start, span_end = starts.min(), ends.max()
+        if period is not None:
+            span_start, span_end = min(span_start, period[0]), max(span_end, period[1])
+        first_week = (span_start - MONDAY_OFFSET) // WEEK_SECONDS * WEEK_SECONDS + MONDAY_OFFSET
+        week_count = max(1, -(-(span_end - first_week) // WEEK_SECONDS))
+        edges = first_week + WEEK_SECONDS * np.arange(week_count + 1, dtype=np.int64)
+        observed = np.minimum(edges[1:], span_end) - np.maximum(edges[:-1], span_start)
+        complete = observed == WEEK_SECONDS
+        week_labels = [
+            datetime.fromtimestamp(int(edge), timezone.utc).strftime('%d.%m.%Y') for edge in edges[:-1]
+        ]
+
+        available = {
+            band: threshold_percent is None or threshold_percent <= band for band in self.BANDS
+        }
+
+        result = {'meter_threshold': threshold_percent}
+        for phase in ['A', 'B', 'C']:
+            in_phase = phases == phase
+            if not in_phase.any():
+                continue
+
+            out_percent = {}
+            for band in self.BANDS:
+                if not available[band]:
+                    out_percent[band] = None
+                    continue
+                mask = in_phase & (deviation > band)
+                merged_starts, merged_ends = self._merge(starts[mask], ends[mask])
+                covered = np.diff(self._covered_until(merged_starts, merged_ends, edges))
+                out_percent[band] = np.where(
+                    observed > 0, covered / np.maximum(observed, 1) * 100, 0.0
+                )
+
+            result[f'phase_{phase}'] = {
+                'weeks': [
+                    {
+                        'week': label,
+                        'out_5': self._week_value(out_percent[5], idx),
+                        'out_10': self._week_value(out_percent[10], idx),
+                        'complete': bool(complete[idx])
+                    }
+                    for idx, label in enumerate(week_labels)
+                ],
+                'worst_out_5': self._worst(out_percent[5], complete),
+                'worst_out_10': self._worst(out_percent[10], complete),
+                'hours_out_5': self._hours(out_percent[5], observed),
+                'hours_out_10': self._hours(out_percent[10], observed)
+            }
+
+        return result
+
+    def _week_value(self, percents, idx):
+        """Доля недели вне полосы, None если полоса недоступна"""
+        if percents is None:
+            return None
+        return round(float(percents[idx]), 2)
+
+    def _worst(self, percents, complete):
+        """Худшая полная неделя, None если полоса недоступна или полных недель нет"""
+        if percents is None or not complete.any():
+            return None
+        return round(float(percents[complete].max()), 2)
+
+    def _hours(self, percents, observed):
+        """Суммарное время вне полосы в часах, None если полоса недоступна"""
+        if percents is None:
+            return None
+        return round(float((percents * observed).sum()) / 100 / 3600, 1)
+
+    def _merge(self, starts, ends):
+        """Объединение пересекающихся интервалов сортировкой и накопленным максимумом"""
+        if len(starts) == 0:
+            return starts, ends
+
+        order = np.argsort(starts, kind='mergesort')
+        starts, ends = starts[order], ends[order]
+        reach = np.maximum.accumulate(ends)
+        # Новый интервал начинается там, где начало правее всех предыдущих концов
+        is_new = np.empty(len(starts), dtype=bool)
+        is_new[0] = True
+        is_new[1:] = starts[1:] > reach[:-1]
+        group_idx = np.flatnonzero(is_new)
+        return starts[group_idx], np.maximum.reduceat(ends, group_idx)
+
+    def _covered_until(self, starts, ends, points):
+        """Суммарная длина непересекающихся интервалов левее каждой точки"""
+        if len(starts) == 0:
+            return np.zeros(len(points), dtype=np.int64)
+
+        cum_length = np.concatenate(([0], np.cumsum(ends - starts)))
+        # Количество интервалов, начавшихся не позже точки
+        count = np.searchsorted(starts, points, side='right')
+        last = np.maximum(count - 1, 0)
+        # Вычитаем еще не прошедшую часть последнего начавшегося интервала
+        remainder = np.where(count > 0, np.clip(ends[last] - points, 0, None), 0)
+        return cum_length[count] - remainder
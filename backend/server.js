@@ -673,6 +673,10 @@ const PuUploadHistory = sequelize.define('PuUploadHistory', {
     type: DataTypes.JSON,
     allowNull: true
   },
+  voltageQuality: {
+    type: DataTypes.JSON,
+    allowNull: true
+  },
   uploadStatus: {
     type: DataTypes.ENUM('success', 'duplicate', 'wrong_period', 'error'),
     defaultValue: 'success'
@@ -3184,6 +3188,7 @@ if (result.has_errors) {
                     hasErrors: result.has_errors,
                     errorSummary: result.has_errors ? result.summary : null,
                     errorDetails: result.has_errors ? result.details : null,
+                    voltageQuality: result.quality || null,
                     uploadStatus: 'success'
                   });
                   console.log('✅ PuUploadHistory created:', record.id);
@@ -5111,6 +5111,20 @@ function UploadedDocuments() {
 }
 
 
+// Худшая полная неделя по каждой фазе: доля времени вне ±5% / ±10%
+// н/д - нет полной недели в журнале или порог счетчика шире полосы
+function formatVoltageQuality(quality) {
+  if (!quality) return '—';
+  const formatPercent = value => (value === null ? 'н/д' : `${value}%`);
+  const parts = ['A', 'B', 'C']
+    .filter(phase => quality[`phase_${phase}`])
+    .map(phase => {
+      const { worst_out_5, worst_out_10 } = quality[`phase_${phase}`];
+      return `${phase}: ${formatPercent(worst_out_5)} / ${formatPercent(worst_out_10)}`;
+    });
+  return parts.length > 0 ? parts.join('; ') : '—';
+}
+
 // Новый компонент расширенного модального окна
 function ExtendedPuModal({ 
   isOpen, 
@@ -5272,6 +5286,7 @@ function ExtendedPuModal({
                             <th>Файл</th>
                             <th>Статус</th>
                             <th>Ошибка</th>
+                            <th>Вне ±5% / ±10%</th>
                           </tr>
                         </thead>
                         <tbody>
@@ -5298,6 +5313,7 @@ function ExtendedPuModal({
                                   '—'
                                 )}
                               </td>
+                              <td>{formatVoltageQuality(upload.voltageQuality)}</td>
                             </tr>
                           ))}
                         </tbody>